@@ -43,136 +43,33 @@ WorkerFactory.createWorker('discodiffusion', handleDiscoDiffusionJob);
 WorkerFactory.createWorker('falvideo', handleFalVideoJob);
 WorkerFactory.createWorker('falimage', handleFalImageJob);
 
-const deforumQueue = new Queue('deforumvideo', {
+const queueOptions = {
   connection: redisClient,
   streams: {
     events: {
       maxLen: 100, // Limit event stream to last 100 events to reduce Redis memory usage
     },
   },
-});
-const hunyuanVideoQueue = new Queue('hunyuanvideo', {
-  connection: redisClient,
-  streams: {
-    events: {
-      maxLen: 100,
-    },
-  },
-});
-const animatediffVideoQueue = new Queue('video', {
-  connection: redisClient,
-  streams: {
-    events: {
-      maxLen: 100,
-    },
-  },
-});
-const imageQueue = new Queue('image', {
-  connection: redisClient,
-  streams: {
-    events: {
-      maxLen: 100,
-    },
-  },
-});
-const uprezVideoQueue = new Queue('uprezvideo', {
-  connection: redisClient,
-  streams: {
-    events: {
-      maxLen: 100,
-    },
-  },
-});
-const wanT2VQueue = new Queue('want2v', {
-  connection: redisClient,
-  streams: {
-    events: {
-      maxLen: 100,
-    },
-  },
-});
-const wanI2VQueue = new Queue('wani2v', {
-  connection: redisClient,
-  streams: {
-    events: {
-      maxLen: 100,
-    },
-  },
-});
-const wanI2VLoraQueue = new Queue('wani2vlora', {
-  connection: redisClient,
-  streams: {
-    events: {
-      maxLen: 100,
-    },
-  },
-});
-const qwenImageQueue = new Queue('qwenimage', {
-  connection: redisClient,
-  streams: {
-    events: {
-      maxLen: 100,
-    },
-  },
-});
-const zImageTurboQueue = new Queue('zimageturbo', {
-  connection: redisClient,
-  streams: {
-    events: {
-      maxLen: 100,
-    },
-  },
-});
-const ltxI2VQueue = new Queue('ltxi2v', {
-  connection: redisClient,
-  streams: {
-    events: {
-      maxLen: 100,
-    },
-  },
-});
-const nvidiaVsrQueue = new Queue('nvidiavsr', {
-  connection: redisClient,
-  streams: {
-    events: {
-      maxLen: 100,
-    },
-  },
-});
-const videoingestQueue = new Queue('videoingest', {
-  connection: redisClient,
-  streams: {
-    events: {
-      maxLen: 100,
-    },
-  },
-});
-const discoDiffusionQueue = new Queue('discodiffusion', {
-  connection: redisClient,
-  streams: {
-    events: {
-      maxLen: 100,
-    },
-  },
-});
-const falVideoQueue = new Queue('falvideo', {
-  connection: redisClient,
-  streams: {
-    events: {
-      maxLen: 100,
-    },
-  },
-});
-const falImageQueue = new Queue('falimage', {
-  connection: redisClient,
-  streams: {
-    events: {
-      maxLen: 100,
-    },
-  },
-});
+};
+
+const deforumQueue = new Queue('deforumvideo', queueOptions);
+const hunyuanVideoQueue = new Queue('hunyuanvideo', queueOptions);
+const animatediffVideoQueue = new Queue('video', queueOptions);
+const imageQueue = new Queue('image', queueOptions);
+const uprezVideoQueue = new Queue('uprezvideo', queueOptions);
+const wanT2VQueue = new Queue('want2v', queueOptions);
+const wanI2VQueue = new Queue('wani2v', queueOptions);
+const wanI2VLoraQueue = new Queue('wani2vlora', queueOptions);
+const qwenImageQueue = new Queue('qwenimage', queueOptions);
+const zImageTurboQueue = new Queue('zimageturbo', queueOptions);
+const ltxI2VQueue = new Queue('ltxi2v', queueOptions);
+const nvidiaVsrQueue = new Queue('nvidiavsr', queueOptions);
+const videoingestQueue = new Queue('videoingest', queueOptions);
+const discoDiffusionQueue = new Queue('discodiffusion', queueOptions);
+const falVideoQueue = new Queue('falvideo', queueOptions);
+const falImageQueue = new Queue('falimage', queueOptions);
 const marketingQueue = new Queue(env.MARKETING_QUEUE_NAME, {
-  connection: redisClient,
+  ...queueOptions,
   streams: {
     events: {
       maxLen: 1000,
@@ -180,8 +77,8 @@ const marketingQueue = new Queue(env.MARKETING_QUEUE_NAME, {
   },
 });
 
-const activeJobs = await hunyuanVideoQueue.getJobs(['active']);
-console.log(`Active jobs: ${JSON.stringify(activeJobs)}`);
+const activeJobCount = await hunyuanVideoQueue.getActiveCount();
+console.log(`Active jobs: ${activeJobCount}`);
 
 const serverAdapter = new ExpressAdapter();
 serverAdapter.setBasePath('/admin/queues');
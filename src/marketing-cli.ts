@@ -106,7 +106,14 @@ const run = async () => {
     process.exit(0);
   }
 
-  const interval = setInterval(async () => {
+  let isChecking = false;
+  let recheckPending = false;
+  const checkRemaining = async () => {
+    if (isChecking) {
+      recheckPending = true;
+      return;
+    }
+    isChecking = true;
     try {
       const counts = await queue.getJobCounts('wait', 'active', 'delayed', 'paused');
       const remaining = (counts.wait || 0) + (counts.active || 0) + (counts.delayed || 0) + (counts.paused || 0);
@@ -119,8 +126,29 @@ const run = async () => {
       }
     } catch (err) {
       console.error(err instanceof Error ? err.message : err);
+    } finally {
+      isChecking = false;
+      if (recheckPending) {
+        recheckPending = false;
+        void checkRemaining();
+      }
     }
-  }, 5000);
+  };
+
+  // the interval covers jobs picked up by other marketing workers
+  let drained = false;
+  worker.on('drained', () => {
+    drained = true;
+    void checkRemaining();
+  });
+  worker.on('completed', () => {
+    if (drained) void checkRemaining();
+  });
+  worker.on('failed', () => {
+    if (drained) void checkRemaining();
+  });
+
+  const interval = setInterval(checkRemaining, 5000);
 
   process.on('SIGINT', async () => {
     clearInterval(interval);
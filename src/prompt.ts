@@ -0,0 +1,19 @@
+import { Command } from 'commander';
+import { CLIService } from './services/cli.service.js';
+
+const program = new Command();
+
+program
+  .name('prompt')
+  .description('Queue job files on the worker and download the results')
+  .argument('<jobfiles...>', 'Job JSON files, routed to a queue by infinidream_algorithm')
+  .option('-o, --output <path>', 'Custom output path (single job file only)')
+  .action(async (jobFiles: string[], options: { output?: string }) => {
+    const cliService = new CLIService();
+    await cliService.processJobFilesAuto(jobFiles, options);
+  });
+
+program.parseAsync(process.argv).catch((error) => {
+  console.error(error?.message || error);
+  process.exit(1);
+});
@@ -1,9 +1,8 @@
 import { Job, Queue, QueueEvents } from 'bullmq';
-import fs from 'fs';
+import { existsSync, readFileSync } from 'fs';
 import path from 'path';
 import { InvalidArgumentError } from 'commander';
 import FormData from 'form-data';
-import { existsSync, readFileSync } from 'fs';
 import { request } from 'undici';
 import { DownloadService } from './download.service.js';
 import { PathResolver } from '../utils/path-resolver.js';
@@ -20,42 +19,69 @@ interface QueueConfig {
   events: QueueEvents;
 }
 
+interface QueuedJob {
+  name: string;
+  data: any;
+}
+
+const QUEUE_NAMES = [
+  'video',
+  'hunyuanvideo',
+  'deforumvideo',
+  'uprezvideo',
+  'want2v',
+  'wani2v',
+  'wani2vlora',
+  'qwenimage',
+  'zimageturbo',
+  'ltxi2v',
+  'nvidiavsr',
+];
+
 export class CLIService {
   private readonly downloadService = new DownloadService();
-  private readonly queuedJobIds = new Set<string>();
+  private readonly queuedJobKeys = new Set<string>();
+  private hasFailedJobs = false;
+  private submitting = false;
   private lastProgress = '';
 
-  private readonly queues: Record<string, QueueConfig> = {
-    video: this.createQueueConfig('video'),
-    hunyuanvideo: this.createQueueConfig('hunyuanvideo'),
-    deforumvideo: this.createQueueConfig('deforumvideo'),
-    uprezvideo: this.createQueueConfig('uprezvideo'),
-    want2v: this.createQueueConfig('want2v'),
-    wani2v: this.createQueueConfig('wani2v'),
-    wani2vlora: this.createQueueConfig('wani2vlora'),
-    qwenimage: this.createQueueConfig('qwenimage'),
-    zimageturbo: this.createQueueConfig('zimageturbo'),
-    ltxi2v: this.createQueueConfig('ltxi2v'),
-    nvidiavsr: this.createQueueConfig('nvidiavsr'),
-  };
-
-  constructor() {
-    this.setupEventListeners();
-  }
+  private readonly queues = new Map<string, QueueConfig>();
 
   async processJobFileAuto(filePath: string, options: JobOptions): Promise<void> {
-    this.validateInputFile(filePath);
+    await this.processJobFilesAuto([filePath], options);
+  }
 
-    let jsonData = this.readJsonFile(filePath);
-    const queueName = this.inferQueueName(jsonData);
+  /**
+   * Queues several job files from one process. Jobs are grouped by queue and
+   * submitted with a single addBulk per queue; the process exits once every
+   * queued job has completed or failed.
+   */
+  async processJobFilesAuto(filePaths: string[], options: JobOptions): Promise<void> {
+    if (filePaths.length > 1 && options.output) {
+      throw new InvalidArgumentError('Output path (-o) can only be used with a single input file');
+    }
 
-    if (queueName === 'wani2v' || queueName === 'wani2vlora' || queueName === 'ltxi2v') {
-      jsonData = await this.processImagesForWanI2V(jsonData);
+    const inputs = filePaths.map((filePath) => {
+      this.validateInputFile(filePath);
+      const jsonData = this.readJsonFile(filePath);
+      return { filePath, jsonData, queueName: this.inferQueueName(jsonData) };
+    });
+
+    const jobsByQueue = new Map<string, QueuedJob[]>();
+
+    for (const input of inputs) {
+      const { filePath, queueName } = input;
+      let { jsonData } = input;
+
+      if (queueName === 'wani2v' || queueName === 'wani2vlora' || queueName === 'ltxi2v') {
+        jsonData = await this.processImagesForWanI2V(jsonData);
+      }
+
+      const job = this.createJob(jsonData, this.createJobOptions(filePath, options));
+      jobsByQueue.set(queueName, [...(jobsByQueue.get(queueName) ?? []), job]);
     }
 
-    const jobOptions = this.createJobOptions(filePath, options);
-    const jobs = await this.queueJob(queueName, jsonData, jobOptions);
-    this.trackJobs(jobs);
+    await this.submitJobs(jobsByQueue);
   }
 
   private inferQueueName(jsonData: any): string {
@@ -106,8 +132,38 @@ export class CLIService {
     const jsonData = this.readJsonFile(filePath);
     const jobOptions = this.createJobOptions(filePath, options);
 
-    const jobs = await this.queueJob(queueName, jsonData, jobOptions);
-    this.trackJobs(jobs);
+    await this.submitJobs(new Map([[queueName, [this.createJob(jsonData, jobOptions)]]]));
+  }
+
+  private async submitJobs(jobsByQueue: Map<string, QueuedJob[]>): Promise<void> {
+    this.submitting = true;
+    try {
+      for (const [queueName, jobs] of jobsByQueue) {
+        this.trackJobs(queueName, await this.queueJobs(queueName, jobs));
+      }
+    } finally {
+      this.submitting = false;
+    }
+    this.exitIfSettled();
+  }
+
+  private async getQueueConfig(name: string): Promise<QueueConfig> {
+    let config = this.queues.get(name);
+    if (!config) {
+      if (!QUEUE_NAMES.includes(name)) {
+        throw new Error(`Unknown queue: ${name}`);
+      }
+      config = this.createQueueConfig(name);
+      this.setupEventListeners(config);
+      try {
+        await config.events.waitUntilReady();
+      } catch (error) {
+        await Promise.allSettled([config.queue.close(), config.events.close()]);
+        throw error;
+      }
+      this.queues.set(name, config);
+    }
+    return config;
   }
 
   private createQueueConfig(name: string): QueueConfig {
@@ -130,25 +186,23 @@ export class CLIService {
     return { name, queue, events };
   }
 
-  private setupEventListeners(): void {
-    Object.values(this.queues).forEach(({ events, name }) => {
-      events.on('completed', (data) => this.handleJobCompleted(data, name));
-      events.on('progress', this.handleJobProgress.bind(this));
-      events.on('failed', (data) => this.handleJobFailed(data, name));
-    });
+  private setupEventListeners({ events, name }: QueueConfig): void {
+    events.on('completed', (data) => this.handleJobCompleted(data, name));
+    events.on('progress', this.handleJobProgress.bind(this));
+    events.on('failed', (data) => this.handleJobFailed(data, name));
   }
 
   private validateInputFile(filePath: string): void {
     if (!filePath.endsWith('.json')) {
       throw new InvalidArgumentError('Input file must be a .json file');
     }
-    if (!fs.existsSync(filePath)) {
+    if (!existsSync(filePath)) {
       throw new InvalidArgumentError(`File not found: ${filePath}`);
     }
   }
 
   private readJsonFile(filePath: string): any {
-    const raw = fs.readFileSync(filePath, 'utf8');
+    const raw = readFileSync(filePath, 'utf8');
     return JSON.parse(raw);
   }
 
@@ -163,32 +217,41 @@ export class CLIService {
     };
   }
 
-  private async queueJob(queueName: string, jsonData: any, jobOptions: any): Promise<Job[]> {
-    const queue = this.queues[queueName]?.queue;
-    if (!queue) {
-      throw new Error(`Unknown queue: ${queueName}`);
-    }
-
-    const job = {
+  private createJob(jsonData: any, jobOptions: any): QueuedJob {
+    return {
       name: 'message',
       data: { ...jsonData, ...jobOptions },
     };
+  }
 
-    console.log(`Running: ${JSON.stringify(job)}`);
-    return queue.addBulk([job]);
+  private async queueJobs(queueName: string, jobs: QueuedJob[]): Promise<Job[]> {
+    const { queue } = await this.getQueueConfig(queueName);
+
+    jobs.forEach((job) => console.log(`Running: ${JSON.stringify(job)}`));
+    return queue.addBulk(jobs);
+  }
+
+  private jobKey(queueName: string, jobId: string): string {
+    return `${queueName}:${jobId}`;
   }
 
-  private trackJobs(jobs: Job[]): void {
+  private trackJobs(queueName: string, jobs: Job[]): void {
     jobs.forEach((job) => {
       if (job?.id) {
-        this.queuedJobIds.add(String(job.id));
+        this.queuedJobKeys.add(this.jobKey(queueName, String(job.id)));
       }
     });
   }
 
-  private async handleJobCompleted(data: { jobId: string }, queueName: string): Promise<void> {
+  private async handleJobCompleted(data: { jobId: string; returnvalue: unknown }, queueName: string): Promise<void> {
+    if (!this.queuedJobKeys.has(this.jobKey(queueName, data.jobId))) {
+      const returnValue = typeof data.returnvalue === 'string' ? data.returnvalue : JSON.stringify(data.returnvalue);
+      console.log(`\n${new Date().toISOString()}: Job finished: ${returnValue} for job ${JSON.stringify(data.jobId)}`);
+      return;
+    }
+
     try {
-      const queue = this.queues[queueName]?.queue;
+      const queue = this.queues.get(queueName)?.queue;
       if (!queue) return;
 
       const job = await Job.fromId(queue, data.jobId);
@@ -196,37 +259,51 @@ export class CLIService {
         `\n${new Date().toISOString()}: Job finished: ${JSON.stringify(job?.returnvalue)} for job ${JSON.stringify(job?.id)}`
       );
 
-      if (!this.queuedJobIds.has(data.jobId)) return;
-
       const returnValue = job?.returnvalue as any;
-      await this.handleJobResult(returnValue, job);
-      process.exit(0);
+      const succeeded = await this.handleJobResult(returnValue, job);
+      this.settleJob(queueName, data.jobId, !succeeded);
     } catch (error) {
       console.error(
         `\n${new Date().toISOString()}: Error retrieving completed job ${data.jobId} from ${queueName}:`,
         error
       );
+      this.settleJob(queueName, data.jobId, true);
     }
   }
 
-  private async handleJobResult(returnValue: any, job: Job): Promise<void> {
+  private async handleJobResult(returnValue: any, job: Job): Promise<boolean> {
     if (returnValue?.r2_url) {
-      await this.handleRemoteDownload(returnValue, job);
-      return;
+      return this.handleRemoteDownload(returnValue, job);
     }
+    return true;
   }
 
-  private async handleRemoteDownload(returnValue: any, job: Job): Promise<void> {
+  private async handleRemoteDownload(returnValue: any, job: Job): Promise<boolean> {
     try {
       const localPath = this.resolveDownloadPath(job);
 
       console.log(`\n${new Date().toISOString()}: Downloading from R2 URL to: ${localPath}`);
       await this.downloadService.downloadFile(returnValue.r2_url, localPath);
       console.log(`Downloaded file saved at: ${localPath}`);
-      process.exit(0);
+      return true;
     } catch (downloadError) {
       console.error(`\n${new Date().toISOString()}: Failed to download from R2:`, downloadError);
-      process.exit(1);
+      return false;
+    }
+  }
+
+  private settleJob(queueName: string, jobId: string, failed: boolean): void {
+    if (!this.queuedJobKeys.delete(this.jobKey(queueName, jobId))) return;
+
+    if (failed) {
+      this.hasFailedJobs = true;
+    }
+    this.exitIfSettled();
+  }
+
+  private exitIfSettled(): void {
+    if (!this.submitting && this.queuedJobKeys.size === 0) {
+      process.exit(this.hasFailedJobs ? 1 : 0);
     }
   }
 
@@ -240,22 +317,13 @@ export class CLIService {
     });
   }
 
-  private async handleJobFailed(data: { jobId: string }, queueName: string): Promise<void> {
-    try {
-      const queue = this.queues[queueName]?.queue;
-      if (!queue) return;
+  private handleJobFailed(data: { jobId: string; failedReason: string }, queueName: string): void {
+    if (!this.queuedJobKeys.has(this.jobKey(queueName, data.jobId))) return;
 
-      const job = await Job.fromId(queue, data.jobId);
-      console.log(`\n${new Date().toISOString()}: Job failed: ${job?.failedReason} for job ${JSON.stringify(job?.id)}`);
-      if (this.queuedJobIds.has(data.jobId)) {
-        process.exit(1);
-      }
-    } catch (error) {
-      console.error(
-        `\n${new Date().toISOString()}: Error retrieving failed job ${data.jobId} from ${queueName}:`,
-        error
-      );
-    }
+    console.log(
+      `\n${new Date().toISOString()}: Job failed: ${data.failedReason} for job ${JSON.stringify(data.jobId)}`
+    );
+    this.settleJob(queueName, data.jobId, true);
   }
 
   private handleJobProgress(data: any): void {
@@ -295,50 +363,47 @@ export class CLIService {
     const baseDir = process.cwd();
     const workerUrl = env.WORKER_URL;
 
-    for (const field of imageFields) {
-      const imagePath = result[field] as string | undefined;
+    await Promise.all(
+      imageFields.map(async (field) => {
+        const imagePath = result[field] as string | undefined;
 
-      if (!imagePath || typeof imagePath !== 'string') {
-        continue;
-      }
+        if (!imagePath || typeof imagePath !== 'string') {
+          return;
+        }
 
-      if (imagePath.startsWith('http://') || imagePath.startsWith('https://')) {
-        continue;
-      }
+        if (imagePath.startsWith('http://') || imagePath.startsWith('https://')) {
+          return;
+        }
 
-      if (!imagePath.includes('/') && !imagePath.includes('\\')) {
-        try {
-          Buffer.from(imagePath, 'base64');
-          continue;
-        } catch {
-          // Not base64, continue to check if it's a file path
+        if (!imagePath.includes('/') && !imagePath.includes('\\')) {
+          return;
         }
-      }
 
-      let resolvedPath: string;
-      if (path.isAbsolute(imagePath)) {
-        resolvedPath = imagePath;
-      } else {
-        resolvedPath = path.resolve(baseDir, imagePath);
-      }
+        let resolvedPath: string;
+        if (path.isAbsolute(imagePath)) {
+          resolvedPath = imagePath;
+        } else {
+          resolvedPath = path.resolve(baseDir, imagePath);
+        }
 
-      if (!existsSync(resolvedPath)) {
-        throw new Error(
-          `Image file not found: "${imagePath}" (resolved: ${resolvedPath}). ` +
-            `Please ensure the image file exists locally before submitting the job.`
-        );
-      }
+        if (!existsSync(resolvedPath)) {
+          throw new Error(
+            `Image file not found: "${imagePath}" (resolved: ${resolvedPath}). ` +
+              `Please ensure the image file exists locally before submitting the job.`
+          );
+        }
 
-      try {
-        console.log(`Uploading ${field} to worker: ${resolvedPath}...`);
-        const presignedUrl = await this.uploadImageToWorker(resolvedPath, workerUrl);
-        result[field] = presignedUrl;
-        console.log(`${field} uploaded: ${presignedUrl.substring(0, 80)}...`);
-      } catch (error: any) {
-        console.error(`Failed to upload ${field} (${resolvedPath}): ${error.message}`);
-        throw new Error(`Failed to upload image for ${field}: ${error.message}`);
-      }
-    }
+        try {
+          console.log(`Uploading ${field} to worker: ${resolvedPath}...`);
+          const presignedUrl = await this.uploadImageToWorker(resolvedPath, workerUrl);
+          result[field] = presignedUrl;
+          console.log(`${field} uploaded: ${presignedUrl.substring(0, 80)}...`);
+        } catch (error: any) {
+          console.error(`Failed to upload ${field} (${resolvedPath}): ${error.message}`);
+          throw new Error(`Failed to upload image for ${field}: ${error.message}`);
+        }
+      })
+    );
 
     return result;
   }
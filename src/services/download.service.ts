@@ -3,6 +3,9 @@ import path from 'path';
 import https from 'https';
 import http from 'http';
 import { URL } from 'url';
+import { pipeline } from 'stream/promises';
+
+const WRITE_BUFFER_BYTES = 1 << 20;
 
 interface DownloadOptions {
   maxRetries?: number;
@@ -49,23 +52,13 @@ export class DownloadService {
           return;
         }
 
-        const fileStream = fs.createWriteStream(destinationPath);
-        response.pipe(fileStream);
-
-        fileStream.on('finish', () => {
-          fileStream.close();
-          resolve();
-        });
-
-        fileStream.on('error', (error) => {
-          this.cleanupFile(destinationPath);
-          reject(error);
-        });
-
-        response.on('error', (error) => {
-          this.cleanupFile(destinationPath);
-          reject(error);
-        });
+        const fileStream = fs.createWriteStream(destinationPath, { highWaterMark: WRITE_BUFFER_BYTES });
+        pipeline(response, fileStream)
+          .then(resolve)
+          .catch((error) => {
+            this.cleanupFile(destinationPath);
+            reject(error);
+          });
       });
 
       request.on('error', reject);
@@ -92,7 +85,7 @@ export class DownloadService {
   }
 
   private async waitForRetry(attempt: number): Promise<void> {
-    const waitTime = Math.pow(2, attempt) * 1000;
+    const waitTime = Math.pow(2, attempt) * 1000 * (0.8 + Math.random() * 0.4);
     return new Promise((resolve) => setTimeout(resolve, waitTime));
   }
 }
@@ -1,9 +1,26 @@
 import { S3Client, PutObjectCommand, GetObjectCommand } from '@aws-sdk/client-s3';
 import { getSignedUrl } from '@aws-sdk/s3-request-presigner';
 import { Readable } from 'stream';
-import { readFileSync, existsSync } from 'fs';
+import { createReadStream, existsSync, statSync } from 'fs';
 import { extname } from 'path';
 import env from '../shared/env.js';
+import r2Client from '../shared/r2.js';
+import { IMAGE_MIME_TO_EXTENSION } from '../shared/mime.js';
+
+const IMAGE_EXTENSION_TO_MIME: Record<string, string> = {
+  '.jpg': 'image/jpeg',
+  '.jpeg': 'image/jpeg',
+  '.png': 'image/png',
+  '.gif': 'image/gif',
+  '.webp': 'image/webp',
+  '.bmp': 'image/bmp',
+  '.svg': 'image/svg+xml',
+  '.tiff': 'image/tiff',
+  '.tif': 'image/tiff',
+  '.ico': 'image/x-icon',
+  '.heif': 'image/heif',
+  '.heic': 'image/heic',
+};
 
 export class R2UploadService {
   private readonly s3Client: S3Client | null;
@@ -16,21 +33,9 @@ export class R2UploadService {
     this.bucketName = env.R2_BUCKET_NAME;
     this.uploadDirectory = env.R2_UPLOAD_DIRECTORY;
     this.imageDirectory = env.R2_IMAGE_DIRECTORY;
-    this.presignedExpiry = parseInt(env.R2_PRESIGNED_EXPIRY, 10);
-
-    if (env.R2_ENDPOINT_URL && env.R2_ACCESS_KEY_ID && env.R2_SECRET_ACCESS_KEY && env.R2_BUCKET_NAME) {
-      this.s3Client = new S3Client({
-        endpoint: env.R2_ENDPOINT_URL,
-        region: 'auto',
-        credentials: {
-          accessKeyId: env.R2_ACCESS_KEY_ID,
-          secretAccessKey: env.R2_SECRET_ACCESS_KEY,
-        },
-        forcePathStyle: true,
-      });
-    } else {
-      this.s3Client = null;
-    }
+    this.presignedExpiry = env.R2_PRESIGNED_EXPIRY;
+
+    this.s3Client = env.R2_BUCKET_NAME ? r2Client : null;
   }
 
   async downloadAndUploadVideo(videoUrl: string, jobId: string, filename?: string): Promise<string> {
@@ -262,20 +267,7 @@ export class R2UploadService {
           fileExtension = ext;
         }
       } else if (contentType) {
-        const mimeToExt: Record<string, string> = {
-          'image/jpeg': '.jpg',
-          'image/jpg': '.jpg',
-          'image/png': '.png',
-          'image/webp': '.webp',
-          'image/gif': '.gif',
-          'image/bmp': '.bmp',
-          'image/svg+xml': '.svg',
-          'image/tiff': '.tiff',
-          'image/x-icon': '.ico',
-          'image/heif': '.heif',
-          'image/heic': '.heic',
-        };
-        fileExtension = mimeToExt[contentType.toLowerCase()] || '.png';
+        fileExtension = `.${IMAGE_MIME_TO_EXTENSION[contentType.toLowerCase()] || 'png'}`;
       }
 
       const objectKey = filename
@@ -337,7 +329,7 @@ export class R2UploadService {
     }
 
     try {
-      const imageBuffer = readFileSync(imagePath);
+      const { size } = statSync(imagePath);
       const fileExtension = extname(imagePath).toLowerCase();
       const contentType = this.getMimeTypeFromExtension(fileExtension);
 
@@ -349,7 +341,8 @@ export class R2UploadService {
       const command = new PutObjectCommand({
         Bucket: this.bucketName,
         Key: objectKey,
-        Body: imageBuffer,
+        Body: createReadStream(imagePath),
+        ContentLength: size,
         ContentType: contentType,
       });
 
@@ -415,21 +408,7 @@ export class R2UploadService {
   }
 
   private getMimeTypeFromExtension(extension: string): string {
-    const extToMime: Record<string, string> = {
-      '.jpg': 'image/jpeg',
-      '.jpeg': 'image/jpeg',
-      '.png': 'image/png',
-      '.gif': 'image/gif',
-      '.webp': 'image/webp',
-      '.bmp': 'image/bmp',
-      '.svg': 'image/svg+xml',
-      '.tiff': 'image/tiff',
-      '.tif': 'image/tiff',
-      '.ico': 'image/x-icon',
-      '.heif': 'image/heif',
-      '.heic': 'image/heic',
-    };
-    return extToMime[extension.toLowerCase()] || 'image/png';
+    return IMAGE_EXTENSION_TO_MIME[extension.toLowerCase()] || 'image/png';
   }
 
   private async generatePresignedUrl(objectKey: string): Promise<string> {
@@ -1,8 +1,9 @@
-import { Job, Queue } from 'bullmq';
+import { Job } from 'bullmq';
 import { PublicEndpointService, PublicEndpointResponse } from './public-endpoint.service.js';
 import { R2UploadService } from './r2-upload.service.js';
 import { RunpodCancelService } from './runpod-cancel.service.js';
 import redisClient from '../shared/redis.js';
+import { getQueue } from '../shared/queues.js';
 
 interface RunpodStatus {
   status: string;
@@ -27,6 +28,8 @@ export class StatusHandlerService {
   private readonly r2UploadService: R2UploadService;
   private readonly runpodCancelService: RunpodCancelService;
   private readonly previewTtlSeconds = 3 * 60 * 60;
+  private readonly initialPollIntervalMs = 1000;
+  private readonly pollBackoffFactor = 1.5;
 
   constructor(private readonly defaultPollIntervalMs: number = 5000) {
     this.r2UploadService = new R2UploadService();
@@ -79,43 +82,24 @@ export class StatusHandlerService {
     const isPublicEndpoint = endpoint instanceof PublicEndpointService;
     let status: RunpodStatus | undefined;
     let lastLogMessage = '';
+    let lastRemoteStatus: string | undefined;
+    let nextPollDelayMs = Math.min(this.initialPollIntervalMs, pollIntervalMs);
     const startedAtMs = Date.now();
 
     do {
-      try {
-        const jobState = await job.getState();
-        if (jobState === 'failed') {
-          await job.log(`${new Date().toISOString()}: Job state is failed, checking if cancelled by user`);
-
-          const queue = new Queue(job.queueName, { connection: redisClient });
-          const freshJob = await queue.getJob(String(job.id));
-          await queue.close();
-
-          if (freshJob?.data?.cancelled_by_user === true) {
-            await job.log(`${new Date().toISOString()}: Job cancelled by user, stopping polling`);
-
-            if (freshJob.data?.cancel_runpod !== false) {
-              await job.log(`${new Date().toISOString()}: Cancelling RunPod job ${runpodId}`);
-              await this.runpodCancelService.cancelJob(endpoint, runpodId);
-            }
-
-            throw new Error('Job was cancelled by user');
-          }
-
-          const failedReason = freshJob?.failedReason || 'Unknown reason';
-          await job.log(`${new Date().toISOString()}: Job failed in queue (${failedReason}), stopping polling`);
-          throw new Error(`Job failed in queue: ${failedReason}`);
-        }
-      } catch (stateError: any) {
-        if (stateError.message !== 'Job was cancelled by user') {
-          console.error('Error checking job state:', stateError);
-        } else {
-          throw stateError;
-        }
+      const [stateCheck, statusCheck] = await Promise.allSettled([
+        this.checkJobState(job, endpoint, runpodId),
+        endpoint.status(runpodId),
+      ]);
+      if (stateCheck.status === 'rejected') {
+        throw stateCheck.reason;
       }
 
       try {
-        const rawStatus = await endpoint.status(runpodId);
+        if (statusCheck.status === 'rejected') {
+          throw statusCheck.reason;
+        }
+        const rawStatus = statusCheck.value;
 
         if (isPublicEndpoint) {
           const publicStatus = rawStatus as PublicEndpointResponse;
@@ -212,19 +196,14 @@ export class StatusHandlerService {
           user_id: job.data.user_id,
         };
 
-        await job.updateProgress(progressData);
+        const writes: Promise<unknown>[] = [job.updateProgress(progressData)];
 
-        const statusForLog = { ...(status as any) };
-        delete statusForLog.preview_frame;
-        if (statusForLog.output && typeof statusForLog.output === 'object') {
-          statusForLog.output = { ...statusForLog.output };
-          delete statusForLog.output.preview_frame;
-        }
-        const logMessage = `Got status ${JSON.stringify(statusForLog)}`;
+        const logMessage = `Got status ${JSON.stringify(progressStatus)}`;
         if (lastLogMessage !== logMessage) {
           lastLogMessage = logMessage;
-          await job.log(`${new Date().toISOString()}: ${logMessage}`);
+          writes.push(job.log(`${new Date().toISOString()}: ${logMessage}`));
         }
+        await Promise.all(writes);
       } catch (error: any) {
         console.error('Error getting endpoint status:', error?.message ?? error);
       }
@@ -234,15 +213,52 @@ export class StatusHandlerService {
         throw new Error(JSON.stringify(status));
       }
       if (status?.completed === false && pollIntervalMs > 0) {
-        await new Promise((resolve) => setTimeout(resolve, pollIntervalMs));
+        if (status.status !== lastRemoteStatus) {
+          lastRemoteStatus = status.status;
+          nextPollDelayMs = Math.min(this.initialPollIntervalMs, pollIntervalMs);
+        }
+        await new Promise((resolve) => setTimeout(resolve, nextPollDelayMs));
+        nextPollDelayMs = Math.min(nextPollDelayMs * this.pollBackoffFactor, pollIntervalMs);
       }
     } while (status?.completed === false);
 
     return status as RunpodStatus;
   }
 
+  private async checkJobState(job: Job, endpoint: any, runpodId: string): Promise<void> {
+    try {
+      const jobState = await job.getState();
+      if (jobState === 'failed') {
+        await job.log(`${new Date().toISOString()}: Job state is failed, checking if cancelled by user`);
+
+        const freshJob = await getQueue(job.queueName).getJob(String(job.id));
+
+        if (freshJob?.data?.cancelled_by_user === true) {
+          await job.log(`${new Date().toISOString()}: Job cancelled by user, stopping polling`);
+
+          if (freshJob.data?.cancel_runpod !== false) {
+            await job.log(`${new Date().toISOString()}: Cancelling RunPod job ${runpodId}`);
+            await this.runpodCancelService.cancelJob(endpoint, runpodId);
+          }
+
+          throw new Error('Job was cancelled by user');
+        }
+
+        const failedReason = freshJob?.failedReason || 'Unknown reason';
+        await job.log(`${new Date().toISOString()}: Job failed in queue (${failedReason}), stopping polling`);
+        throw new Error(`Job failed in queue: ${failedReason}`);
+      }
+    } catch (stateError: any) {
+      if (stateError.message !== 'Job was cancelled by user') {
+        console.error('Error checking job state:', stateError);
+      } else {
+        throw stateError;
+      }
+    }
+  }
+
   private extractResult(status: RunpodStatus): any {
-    const result = JSON.parse(JSON.stringify(status))?.output || {};
+    const result: any = { ...(status.output || {}) };
     if (typeof status.executionTime === 'number') {
       result.render_duration = status.executionTime;
     }
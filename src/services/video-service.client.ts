@@ -1,9 +1,11 @@
-import axios from 'axios';
 import { Queue } from 'bullmq';
 import { Readable } from 'stream';
 import { S3Client, PutObjectCommand } from '@aws-sdk/client-s3';
 import env from '../shared/env.js';
-import redisClient from '../shared/redis.js';
+import r2Client from '../shared/r2.js';
+import backendApi from '../shared/backend.js';
+import { IMAGE_MIME_TO_EXTENSION } from '../shared/mime.js';
+import { getQueue } from '../shared/queues.js';
 
 interface DreamInfo {
   uuid: string;
@@ -17,39 +19,19 @@ interface DreamInfo {
 }
 
 export class VideoServiceClient {
-  private readonly backendUrl: string;
-  private readonly backendApiKey: string;
   private readonly s3Client: S3Client | null;
   private readonly bucketName: string;
   private readonly videoingestQueue: Queue;
 
   constructor() {
-    this.backendUrl = env.BACKEND_URL;
-    this.backendApiKey = env.BACKEND_API_KEY;
     this.bucketName = env.R2_BUCKET_NAME;
-    this.videoingestQueue = new Queue('videoingest', { connection: redisClient });
-
-    if (env.R2_ENDPOINT_URL && env.R2_ACCESS_KEY_ID && env.R2_SECRET_ACCESS_KEY) {
-      this.s3Client = new S3Client({
-        endpoint: env.R2_ENDPOINT_URL,
-        region: 'auto',
-        credentials: {
-          accessKeyId: env.R2_ACCESS_KEY_ID,
-          secretAccessKey: env.R2_SECRET_ACCESS_KEY,
-        },
-        forcePathStyle: true,
-      });
-    } else {
-      this.s3Client = null;
-    }
+    this.videoingestQueue = getQueue('videoingest');
+    this.s3Client = r2Client;
   }
 
   async uploadGeneratedVideo(dreamUuid: string, videoUrl: string, renderDuration?: number): Promise<boolean> {
     try {
-      const dream = await this.getDreamInfo(dreamUuid);
-      const userIdentifier = dream.user.cognitoId || dream.user.uuid;
-
-      const r2Path = await this.uploadVideoToR2(videoUrl, dreamUuid, userIdentifier);
+      const r2Path = await this.uploadVideoToR2(videoUrl, dreamUuid);
       await this.updateDreamOriginalVideo(dreamUuid, r2Path, 'video', renderDuration);
 
       await this.videoingestQueue.add('message', {
@@ -73,10 +55,7 @@ export class VideoServiceClient {
 
   async uploadGeneratedImage(dreamUuid: string, imageUrl: string, renderDuration?: number): Promise<boolean> {
     try {
-      const dream = await this.getDreamInfo(dreamUuid);
-      const userIdentifier = dream.user.cognitoId || dream.user.uuid;
-
-      const { r2Path, extension } = await this.uploadImageToR2(imageUrl, dreamUuid, userIdentifier);
+      const { r2Path, extension } = await this.uploadImageToR2(imageUrl, dreamUuid);
       await this.updateDreamOriginalVideo(dreamUuid, r2Path, 'image', renderDuration);
 
       await this.videoingestQueue.add('message', {
@@ -99,26 +78,23 @@ export class VideoServiceClient {
   }
 
   async getDreamInfo(dreamUuid: string): Promise<DreamInfo> {
-    const response = await axios.get(`${this.backendUrl}/dream/${dreamUuid}`, {
-      headers: {
-        Authorization: `Api-Key ${this.backendApiKey}`,
-        'User-Agent': 'EdreamSDK',
-      },
+    const response = await backendApi.get(`/dream/${dreamUuid}`, {
+      headers: { 'User-Agent': 'EdreamSDK' },
     });
     return response.data.data.dream;
   }
 
+  private async getUserIdentifier(dreamUuid: string): Promise<string> {
+    const dream = await this.getDreamInfo(dreamUuid);
+    return dream.user.cognitoId || dream.user.uuid;
+  }
+
   async setDreamFailed(dreamUuid: string, error: string): Promise<void> {
     try {
-      await axios.post(
-        `${this.backendUrl}/dream/${dreamUuid}/status/failed`,
+      await backendApi.post(
+        `/dream/${dreamUuid}/status/failed`,
         { error },
-        {
-          headers: {
-            Authorization: `Api-Key ${this.backendApiKey}`,
-            'Content-Type': 'application/json',
-          },
-        }
+        { headers: { 'Content-Type': 'application/json' } }
       );
     } catch (error: any) {
       console.error(`Failed to set dream ${dreamUuid} as failed:`, {
@@ -149,15 +125,12 @@ export class VideoServiceClient {
       updateData.mediaType = mediaType;
     }
 
-    await axios.put(`${this.backendUrl}/dream/${dreamUuid}`, updateData, {
-      headers: {
-        Authorization: `Api-Key ${this.backendApiKey}`,
-        'Content-Type': 'application/json',
-      },
+    await backendApi.put(`/dream/${dreamUuid}`, updateData, {
+      headers: { 'Content-Type': 'application/json' },
     });
   }
 
-  private async uploadVideoToR2(videoUrl: string, dreamUuid: string, userIdentifier: string): Promise<string> {
+  private async uploadVideoToR2(videoUrl: string, dreamUuid: string): Promise<string> {
     if (!this.s3Client) {
       throw new Error('R2 client not initialized');
     }
@@ -168,6 +141,7 @@ export class VideoServiceClient {
       return r2Path;
     }
 
+    const userIdentifier = await this.getUserIdentifier(dreamUuid);
     const response = await fetch(videoUrl);
     if (!response.ok) {
       throw new Error(`Failed to fetch video: ${response.status} ${response.statusText}`);
@@ -177,21 +151,15 @@ export class VideoServiceClient {
       throw new Error('Response body is null');
     }
 
-    const stream = Readable.fromWeb(response.body as ReadableStream);
-    const chunks: Buffer[] = [];
-
-    for await (const chunk of stream) {
-      chunks.push(Buffer.from(chunk));
-    }
-
-    const videoBuffer = Buffer.concat(chunks);
+    const { body, contentLength } = await this.getUploadBody(response);
 
     const objectKey = `${userIdentifier}/${dreamUuid}/${dreamUuid}.mp4`;
 
     const command = new PutObjectCommand({
       Bucket: this.bucketName,
       Key: objectKey,
-      Body: videoBuffer,
+      Body: body,
+      ContentLength: contentLength,
       ContentType: 'video/mp4',
     });
 
@@ -200,11 +168,7 @@ export class VideoServiceClient {
     return objectKey;
   }
 
-  private async uploadImageToR2(
-    imageUrl: string,
-    dreamUuid: string,
-    userIdentifier: string
-  ): Promise<{ r2Path: string; extension: string }> {
+  private async uploadImageToR2(imageUrl: string, dreamUuid: string): Promise<{ r2Path: string; extension: string }> {
     if (!this.s3Client) {
       throw new Error('R2 client not initialized');
     }
@@ -216,6 +180,7 @@ export class VideoServiceClient {
       return { r2Path, extension };
     }
 
+    const userIdentifier = await this.getUserIdentifier(dreamUuid);
     const response = await fetch(imageUrl);
     if (!response.ok) {
       throw new Error(`Failed to fetch image: ${response.status} ${response.statusText}`);
@@ -225,14 +190,7 @@ export class VideoServiceClient {
       throw new Error('Response body is null');
     }
 
-    const stream = Readable.fromWeb(response.body as ReadableStream);
-    const chunks: Buffer[] = [];
-
-    for await (const chunk of stream) {
-      chunks.push(Buffer.from(chunk));
-    }
-
-    const imageBuffer = Buffer.concat(chunks);
+    const { body, contentLength } = await this.getUploadBody(response);
 
     // Determine extension from content-type or URL
     const contentType = response.headers.get('content-type') || 'image/png';
@@ -242,7 +200,8 @@ export class VideoServiceClient {
     const command = new PutObjectCommand({
       Bucket: this.bucketName,
       Key: objectKey,
-      Body: imageBuffer,
+      Body: body,
+      ContentLength: contentLength,
       ContentType: contentType,
     });
 
@@ -251,29 +210,28 @@ export class VideoServiceClient {
     return { r2Path: objectKey, extension };
   }
 
+  private async getUploadBody(response: Response): Promise<{ body: Readable | Buffer; contentLength: number }> {
+    const stream = Readable.fromWeb(response.body as ReadableStream);
+    const contentLength = Number(response.headers.get('content-length'));
+    if (!response.headers.has('content-encoding') && Number.isInteger(contentLength) && contentLength > 0) {
+      return { body: stream, contentLength };
+    }
+
+    const chunks: Buffer[] = [];
+    for await (const chunk of stream) {
+      chunks.push(Buffer.from(chunk));
+    }
+    const buffer = Buffer.concat(chunks);
+    return { body: buffer, contentLength: buffer.length };
+  }
+
   private getExtensionFromContentType(contentType: string): string {
-    const mimeToExt: Record<string, string> = {
-      'image/jpeg': 'jpg',
-      'image/jpg': 'jpg',
-      'image/png': 'png',
-      'image/webp': 'webp',
-      'image/gif': 'gif',
-      'image/bmp': 'bmp',
-      'image/svg+xml': 'svg',
-      'image/tiff': 'tiff',
-      'image/x-icon': 'ico',
-      'image/heif': 'heif',
-      'image/heic': 'heic',
-    };
-    return mimeToExt[contentType.toLowerCase()] || 'png';
+    return IMAGE_MIME_TO_EXTENSION[contentType.toLowerCase()] || 'png';
   }
 
   private getExtensionFromR2Path(r2Path: string): string {
-    const parts = r2Path.split('.');
-    if (parts.length > 1) {
-      return parts[parts.length - 1];
-    }
-    return 'png';
+    const dotIndex = r2Path.lastIndexOf('.');
+    return dotIndex === -1 ? 'png' : r2Path.slice(dotIndex + 1);
   }
 
   private extractR2PathFromPresignedUrl(url: string): string | null {
@@ -0,0 +1,12 @@
+import axios from 'axios';
+import env from './env.js';
+
+/**
+ * shared backend api client, authenticated with the worker api key
+ */
+const backendApi = axios.create({
+  baseURL: env.BACKEND_URL,
+  headers: { Authorization: `Api-Key ${env.BACKEND_API_KEY}` },
+});
+
+export default backendApi;
@@ -35,7 +35,7 @@ export const env = cleanEnv(process.env, {
   R2_SECRET_ACCESS_KEY: str({ default: '' }),
   R2_UPLOAD_DIRECTORY: str({ default: 'video-outputs' }),
   R2_IMAGE_DIRECTORY: str({ default: 'image-inputs' }),
-  R2_PRESIGNED_EXPIRY: str({ default: '86400' }),
+  R2_PRESIGNED_EXPIRY: num({ default: 86400 }),
 
   WORKER_URL: str({ default: 'http://localhost:3000' }),
   VIDEO_SERVICE_URL: str({ default: 'http://localhost:5000' }),
@@ -0,0 +1,16 @@
+/**
+ * image mime type to file extension, without the leading dot
+ */
+export const IMAGE_MIME_TO_EXTENSION: Record<string, string> = {
+  'image/jpeg': 'jpg',
+  'image/jpg': 'jpg',
+  'image/png': 'png',
+  'image/webp': 'webp',
+  'image/gif': 'gif',
+  'image/bmp': 'bmp',
+  'image/svg+xml': 'svg',
+  'image/tiff': 'tiff',
+  'image/x-icon': 'ico',
+  'image/heif': 'heif',
+  'image/heic': 'heic',
+};
@@ -0,0 +1,16 @@
+import { Queue } from 'bullmq';
+import redisClient from './redis.js';
+
+const queuesByName = new Map<string, Queue>();
+
+/**
+ * long-lived queue handle on the shared redis client, created on first use
+ */
+export function getQueue(name: string): Queue {
+  let queue = queuesByName.get(name);
+  if (!queue) {
+    queue = new Queue(name, { connection: redisClient });
+    queuesByName.set(name, queue);
+  }
+  return queue;
+}
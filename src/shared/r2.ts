@@ -0,0 +1,20 @@
+import { S3Client } from '@aws-sdk/client-s3';
+import env from './env.js';
+
+/**
+ * shared r2 client, null when r2 credentials are not configured
+ */
+const r2Client =
+  env.R2_ENDPOINT_URL && env.R2_ACCESS_KEY_ID && env.R2_SECRET_ACCESS_KEY
+    ? new S3Client({
+        endpoint: env.R2_ENDPOINT_URL,
+        region: 'auto',
+        credentials: {
+          accessKeyId: env.R2_ACCESS_KEY_ID,
+          secretAccessKey: env.R2_SECRET_ACCESS_KEY,
+        },
+        forcePathStyle: true,
+      })
+    : null;
+
+export default r2Client;
@@ -1,15 +1,17 @@
-import { Job, Queue } from 'bullmq';
+import { Job } from 'bullmq';
 import { getModelConfig } from '../config/models.config.js';
 import { getImageProvider, getProvider } from '../providers/index.js';
 import { resolveProviderKey } from '../providers/key-resolver.js';
 import { NormalizedImageInput, NormalizedVideoInput, ProviderStatus } from '../providers/provider.types.js';
 import { VideoServiceClient } from '../services/video-service.client.js';
 import { processImageForEndpoint } from './job-handlers.js';
-import redisClient from '../shared/redis.js';
+import { getQueue } from '../shared/queues.js';
 
 const videoServiceClient = new VideoServiceClient();
 
-const POLL_INTERVAL_MS = 5000;
+const INITIAL_POLL_INTERVAL_MS = 1000;
+const MAX_POLL_INTERVAL_MS = 5000;
+const POLL_BACKOFF_FACTOR = 1.5;
 
 export async function handleFalVideoJob(job: Job): Promise<unknown> {
   const {
@@ -36,9 +38,9 @@ export async function handleFalVideoJob(job: Job): Promise<unknown> {
     throw new Error(`Model "${infinidream_algorithm}" is not a video model`);
   }
   const provider = getProvider(modelConfig.provider);
-  const apiKey = await resolveProviderKey(modelConfig.provider, job);
 
-  const [startImageUrl, endImageUrl] = await Promise.all([
+  const [apiKey, startImageUrl, endImageUrl] = await Promise.all([
+    resolveProviderKey(modelConfig.provider, job),
     processImageForEndpoint(image, String(job.id)),
     endImage && typeof endImage === 'string'
       ? processImageForEndpoint(endImage, String(job.id))
@@ -154,9 +156,12 @@ async function pollUntilComplete<T extends { status: ProviderStatus; completed:
   cancel: () => Promise<void>
 ): Promise<T> {
   let lastStatus = '';
+  let pollIntervalMs = INITIAL_POLL_INTERVAL_MS;
 
   for (;;) {
-    if (await isCancelledByUser(job)) {
+    const [cancelled, pollResult] = await Promise.allSettled([isCancelledByUser(job), poll()]);
+
+    if (cancelled.status === 'fulfilled' && cancelled.value) {
       await job.log(`${new Date().toISOString()}: Job cancelled by user, cancelling fal request ${requestId}`);
       try {
         await cancel();
@@ -166,25 +171,33 @@ async function pollUntilComplete<T extends { status: ProviderStatus; completed:
       throw new Error('Job was cancelled by user');
     }
 
-    const result = await poll();
+    if (pollResult.status === 'rejected') {
+      throw pollResult.reason;
+    }
+    const result = pollResult.value;
 
-    await job.updateProgress({
-      status: result.status,
-      completed: result.completed,
-      dream_uuid: job.data.dream_uuid,
-      user_id: job.data.user_id,
-    });
+    const writes: Promise<unknown>[] = [
+      job.updateProgress({
+        status: result.status,
+        completed: result.completed,
+        dream_uuid: job.data.dream_uuid,
+        user_id: job.data.user_id,
+      }),
+    ];
 
     if (result.status !== lastStatus) {
       lastStatus = result.status;
-      await job.log(`${new Date().toISOString()}: fal status ${result.status}`);
+      pollIntervalMs = INITIAL_POLL_INTERVAL_MS;
+      writes.push(job.log(`${new Date().toISOString()}: fal status ${result.status}`));
     }
+    await Promise.all(writes);
 
     if (result.completed) {
       return result;
     }
 
-    await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+    await new Promise((resolve) => setTimeout(resolve, pollIntervalMs));
+    pollIntervalMs = Math.min(pollIntervalMs * POLL_BACKOFF_FACTOR, MAX_POLL_INTERVAL_MS);
   }
 }
 
@@ -197,9 +210,7 @@ async function isCancelledByUser(job: Job): Promise<boolean> {
     if (state !== 'failed') {
       return false;
     }
-    const queue = new Queue(job.queueName, { connection: redisClient });
-    const freshJob = await queue.getJob(String(job.id));
-    await queue.close();
+    const freshJob = await getQueue(job.queueName).getJob(String(job.id));
     return freshJob?.data?.cancelled_by_user === true;
   } catch {
     return false;
@@ -1,6 +1,6 @@
 import { Job } from 'bullmq';
-import { readFileSync } from 'fs';
-import { existsSync } from 'fs';
+import { existsSync, readFileSync } from 'fs';
+import { fetch } from 'undici';
 import { endpoints } from '../config/runpod.config.js';
 import { StatusHandlerService } from '../services/status-handler.service.js';
 import { R2UploadService } from '../services/r2-upload.service.js';
@@ -578,9 +578,10 @@ export async function handleWanI2VJob(job: Job): Promise<any> {
   return result;
 }
 
+const UUID_REGEX = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
+
 function isUuid(str: string): boolean {
-  const uuidRegex = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
-  return uuidRegex.test(str);
+  return UUID_REGEX.test(str);
 }
 
 async function resolveUrlFromDreamUuid(dreamUuid: string, expectedMediaType?: string): Promise<string> {
@@ -666,16 +667,10 @@ export async function processImageForEndpoint(imageInput: string, jobId: string)
     }
   }
 
-  try {
-    Buffer.from(imageInput, 'base64');
-    return imageInput;
-  } catch {
-    throw new Error(`Image input "${imageInput}" is not a valid URL, existing file path, base64 string, or dream UUID`);
-  }
+  return imageInput;
 }
 
 async function fetchUrlAsBase64(url: string): Promise<string> {
-  const { fetch } = await import('undici');
   const response = await fetch(url);
   if (!response.ok) {
     throw new Error(`Failed to download from ${url}: ${response.status}`);
@@ -720,18 +715,25 @@ export async function handleWanI2VLoraJob(job: Job): Promise<any> {
     enable_safety_checker,
   };
 
-  if (image) {
-    if (typeof image !== 'string') {
-      throw new Error('image must be a string URL, local file path, base64 string, or dream UUID');
-    }
-    input.image = await processImageForEndpoint(image, String(job.id));
+  if (image && typeof image !== 'string') {
+    throw new Error('image must be a string URL, local file path, base64 string, or dream UUID');
   }
 
-  if (last_image) {
-    if (typeof last_image !== 'string') {
-      throw new Error('last_image must be a string URL, local file path, base64 string, or dream UUID');
-    }
-    input.last_image = await processImageForEndpoint(last_image, String(job.id));
+  if (last_image && typeof last_image !== 'string') {
+    throw new Error('last_image must be a string URL, local file path, base64 string, or dream UUID');
+  }
+
+  const [resolvedImage, resolvedLastImage] = await Promise.all([
+    image ? processImageForEndpoint(image, String(job.id)) : Promise.resolve(undefined),
+    last_image ? processImageForEndpoint(last_image, String(job.id)) : Promise.resolve(undefined),
+  ]);
+
+  if (resolvedImage !== undefined) {
+    input.image = resolvedImage;
+  }
+
+  if (resolvedLastImage !== undefined) {
+    input.last_image = resolvedLastImage;
   }
 
   if (loras && Array.isArray(loras)) {
@@ -830,6 +832,18 @@ export async function handleQwenImageJob(job: Job): Promise<any> {
   return result;
 }
 
+const Z_IMAGE_TURBO_SIZES: ZImageTurboSize[] = [
+  '512*512',
+  '768*768',
+  '1024*1024',
+  '1280*1280',
+  '1024*768',
+  '768*1024',
+  '1280*720',
+  '720*1280',
+];
+const Z_IMAGE_TURBO_OUTPUT_FORMATS: ZImageTurboOutputFormat[] = ['png', 'jpeg', 'webp'];
+
 export async function handleZImageTurboJob(job: Job): Promise<any> {
   const {
     prompt,
@@ -859,27 +873,15 @@ export async function handleZImageTurboJob(job: Job): Promise<any> {
     input.strength = strength;
   }
 
-  const VALID_SIZES: ZImageTurboSize[] = [
-    '512*512',
-    '768*768',
-    '1024*1024',
-    '1280*1280',
-    '1024*768',
-    '768*1024',
-    '1280*720',
-    '720*1280',
-  ];
-  const VALID_OUTPUT_FORMATS: ZImageTurboOutputFormat[] = ['png', 'jpeg', 'webp'];
-
   if (size) {
-    if (!VALID_SIZES.includes(size)) {
-      throw new Error(`size must be one of: ${VALID_SIZES.join(', ')}`);
+    if (!Z_IMAGE_TURBO_SIZES.includes(size)) {
+      throw new Error(`size must be one of: ${Z_IMAGE_TURBO_SIZES.join(', ')}`);
     }
     input.size = size;
   }
 
-  if (!VALID_OUTPUT_FORMATS.includes(output_format)) {
-    throw new Error(`output_format must be one of: ${VALID_OUTPUT_FORMATS.join(', ')}`);
+  if (!Z_IMAGE_TURBO_OUTPUT_FORMATS.includes(output_format)) {
+    throw new Error(`output_format must be one of: ${Z_IMAGE_TURBO_OUTPUT_FORMATS.join(', ')}`);
   }
 
   const { id: runpodId } = await endpoints.zImageTurbo.run(input);
@@ -1645,17 +1647,20 @@ function createHunyuanWorkflow(params: {
   };
 }
 
+const DISCO_DIFFUSION_INTERNAL_KEYS = new Set([
+  'dream_uuid',
+  'source_dream_uuid',
+  'auto_upload',
+  'infinidream_algorithm',
+  'previous_dream_status',
+  'runpod_id',
+]);
+
 export async function handleDiscoDiffusionJob(job: Job): Promise<any> {
   const { dream_uuid, source_dream_uuid, auto_upload = true } = job.data || {};
-  const INTERNAL_KEYS = new Set([
-    'dream_uuid',
-    'source_dream_uuid',
-    'auto_upload',
-    'infinidream_algorithm',
-    'previous_dream_status',
-    'runpod_id',
-  ]);
-  const settings = Object.fromEntries(Object.entries(job.data || {}).filter(([k]) => !INTERNAL_KEYS.has(k)));
+  const settings = Object.fromEntries(
+    Object.entries(job.data || {}).filter(([k]) => !DISCO_DIFFUSION_INTERNAL_KEYS.has(k))
+  );
 
   const input: Record<string, unknown> = {
     settings: source_dream_uuid ? { ...settings, source_dream_uuid } : settings,
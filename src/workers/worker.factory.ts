@@ -17,17 +17,17 @@ export class WorkerFactory {
     });
 
     worker.on('failed', async (job, error: Error) => {
-      const serializedError = this.serializeError(error);
-      const rawErrorMessage = this.extractRawErrorMessage(error);
-
       const isCancelled = this.isUserCancellation(job, error);
 
       if (isCancelled) {
-        console.info(`Job cancelled by user: ${name}, job data: ${JSON.stringify(job?.toJSON())}`);
+        console.info(`Job cancelled by user: ${name}, ${this.describeJob(job)}`);
         return;
       }
 
-      console.error(`Job failed: ${name} error: ${serializedError}, job data: ${JSON.stringify(job?.toJSON())}`);
+      const serializedError = this.serializeError(error);
+      const rawErrorMessage = this.extractRawErrorMessage(error);
+
+      console.error(`Job failed: ${name} error: ${serializedError}, ${this.describeJob(job)}`);
 
       const jobData = job?.data;
       if (jobData?.dream_uuid) {
@@ -84,6 +84,13 @@ export class WorkerFactory {
     return false;
   }
 
+  private static describeJob(job: any): string {
+    if (env.DEBUG) {
+      return `job data: ${JSON.stringify(job?.toJSON())}`;
+    }
+    return `job id: ${job?.id}, dream: ${job?.data?.dream_uuid}`;
+  }
+
   private static serializeError(error: Error): string {
     return JSON.stringify(error, Object.getOwnPropertyNames(error));
   }